@@ -40,6 +40,9 @@ def format_time_diff(timestamp1, timestamp2):
 
     return "".join(parts) if parts else "0s"
 
+def format_signed_ms(seconds):
+    return f"{seconds * 1000:.3f} ms"
+
 def get_time_diff_seconds(timestamp1, timestamp2):
     # Calculate difference in seconds with ms precision
     diff = abs((timestamp1 - timestamp2).total_seconds())
@@ -125,16 +128,85 @@ def compare_timestamps(file1_path, file2_path):
         print(f"Maximum difference: {format_time_diff(datetime.now(), datetime.now() + timedelta(seconds=max_diff_seconds))}")
         print(f"Minimum difference: {format_time_diff(datetime.now(), datetime.now() + timedelta(seconds=min_diff_seconds))}")
 
+def load_timestamps(file_path):
+    timestamps = {}
+    with open(file_path, 'r') as f:
+        for line in f:
+            timestamp, tx_hash = parse_timestamp_line(line)
+            if timestamp and tx_hash:
+                timestamps[tx_hash] = timestamp
+    return timestamps
+
+def compare_commitments(file_paths):
+    # Files are ordered from the lowest commitment level to the highest,
+    # e.g. txs_geyser.txt txs_geyser_confirmed.txt txs_geyser_finalized.txt
+    names = [os.path.basename(path) for path in file_paths]
+    levels = [load_timestamps(path) for path in file_paths]
+
+    # Pairs of (from, to) indexes: every next level, plus first to last
+    pairs = [(i, i + 1) for i in range(len(file_paths) - 1)]
+    if len(file_paths) > 2:
+        pairs.append((0, len(file_paths) - 1))
+
+    headers = [f"{names[a]} -> {names[b]}" for a, b in pairs]
+
+    print("\nCommitment Delays Per Transaction:")
+    print("=" * 100)
+    print(f"{'Transaction Hash':<64} " + " ".join(headers))
+    print("-" * 100)
+
+    for tx_hash in sorted(set().union(*levels)):
+        row = []
+        for a, b in pairs:
+            if tx_hash in levels[a] and tx_hash in levels[b]:
+                row.append(format_signed_ms((levels[b][tx_hash] - levels[a][tx_hash]).total_seconds()))
+            else:
+                row.append("-")
+
+        print(f"{tx_hash:<64} " + " ".join(f"{diff_str:<{len(header)}}" for diff_str, header in zip(row, headers)))
+
+    print("=" * 100)
+
+    # Print results
+    print(f"\nComparison Results:")
+    for name, timestamps in zip(names, levels):
+        print(f"{name} transactions: {len(timestamps)}")
+
+    for (a, b), header in zip(pairs, headers):
+        in_both = levels[a].keys() & levels[b].keys()
+        missing = levels[a].keys() - levels[b].keys()
+
+        print(f"\n{header}:")
+        print(f"Matched transactions: {len(in_both)}")
+        print(f"Missing from {names[b]}: {len(missing)}")
+        if not in_both:
+            continue
+
+        pair_seconds = [(levels[b][tx_hash] - levels[a][tx_hash]).total_seconds() for tx_hash in in_both]
+        avg_diff_seconds = sum(pair_seconds) / len(pair_seconds)
+        print(f"Average delay: {format_signed_ms(avg_diff_seconds)}")
+        print(f"Maximum delay: {format_signed_ms(max(pair_seconds))}")
+        print(f"Minimum delay: {format_signed_ms(min(pair_seconds))}")
+        print(f"Arrived out of order: {sum(1 for diff in pair_seconds if diff < 0)}")
+
+def print_usage():
+    print("Usage: python compare.py <file1> <file2>")
+    print("       python compare.py --commitments <processed> <confirmed> [<finalized>]")
+
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print("Usage: python compare_timestamps.py <file1> <file2>")
+    if len(sys.argv) > 1 and sys.argv[1] == "--commitments":
+        if len(sys.argv) < 4:
+            print_usage()
+            sys.exit(1)
+    elif len(sys.argv) != 3:
+        print_usage()
         sys.exit(1)
 
-    file1_path = sys.argv[1]
-    file2_path = sys.argv[2]
-
     try:
-        compare_timestamps(file1_path, file2_path)
+        if sys.argv[1] == "--commitments":
+            compare_commitments(sys.argv[2:])
+        else:
+            compare_timestamps(sys.argv[1], sys.argv[2])
     except FileNotFoundError as e:
         print(f"Error: {e}")
         sys.exit(1)
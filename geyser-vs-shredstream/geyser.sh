@@ -7,34 +7,67 @@ BENCH_DURATION_SECONDS=300
 YELLOWSTONE_GRPC_URL=${YELLOWSTONE_GRPC_URL:-"solana-yellowstone-grpc.rpcfast.net:443"}
 YELLOWSTONE_GRPC_X_TOKEN=${YELLOWSTONE_GRPC_X_TOKEN:-"1234567890"}
 SCRIPT_DIR="$(dirname $(realpath $0))"
-FILENAME="${SCRIPT_DIR}/results/txs_geyser.txt"
+FILENAME_PREFIX="${SCRIPT_DIR}/results/txs_geyser"
+# space-separated list, one parallel subscription per level: processed, confirmed, finalized.
+# Keep the default when comparing with shredstream.sh, every extra level adds local CPU load
+# that skews the locally taken timestamps.
+# processed is stored in txs_geyser.txt, other levels in txs_geyser_<level>.txt
+COMMITMENT_LEVELS=${COMMITMENT_LEVELS:-"processed"}
+# comma-separated lists of base58 pubkeys, empty means no filter.
+# PROGRAM_IDS are merged into ACCOUNT_INCLUDE, which matches txs touching ANY listed key,
+# so setting both widens the stream. Use ACCOUNT_REQUIRED to match txs touching ALL listed keys.
+ACCOUNT_INCLUDE=${ACCOUNT_INCLUDE:-""}
+ACCOUNT_EXCLUDE=${ACCOUNT_EXCLUDE:-""}
+ACCOUNT_REQUIRED=${ACCOUNT_REQUIRED:-""}
+PROGRAM_IDS=${PROGRAM_IDS:-""}
 
 ########################################################
 ###### do not modify below here ########################
 ########################################################
 
-SUBSCRIBE_REQUEST_JSON='{
-    "slots": {},
-    "accounts": {},
-    "transactions": {
-        "alltxs": {}
-    },
-    "blocks": {},
-    "blocks_meta": {},
-    "accounts_data_slice": [],
-    "commitment": 0
-}'
+# program ids are matched through account_include, as a transaction
+# invoking a program always has it among its account keys (OR with ACCOUNT_INCLUDE)
+subscribe_request_json() {
+    jq -n \
+        --arg commitment "${1}" \
+        --arg account_include "${ACCOUNT_INCLUDE},${PROGRAM_IDS}" \
+        --arg account_exclude "${ACCOUNT_EXCLUDE}" \
+        --arg account_required "${ACCOUNT_REQUIRED}" \
+        'def csv: split(",") | map(gsub("^\\s+|\\s+$"; "")) | map(select(length > 0));
+        {
+            "slots": {},
+            "accounts": {},
+            "transactions": {
+                "alltxs": {
+                    "account_include": ($account_include | csv),
+                    "account_exclude": ($account_exclude | csv),
+                    "account_required": ($account_required | csv)
+                }
+            },
+            "blocks": {},
+            "blocks_meta": {},
+            "accounts_data_slice": [],
+            "commitment": ($commitment | ascii_upcase)
+        }'
+}
 
 subscribe_txs() {
     grpcurl \
         -max-time ${BENCH_DURATION_SECONDS} \
         -H "X-Token: ${2}" \
         -proto geyser.proto \
-        -d "${SUBSCRIBE_REQUEST_JSON}" \
+        -d "$(subscribe_request_json ${3})" \
         ${1} \
         geyser.Geyser/Subscribe
 }
 
+capture_txs() {
+    while read -r line; do
+        sig=$(echo "$line" | base64 -d | base58)
+        echo "$(date -u '+%Y-%m-%dT%H:%M:%S.%N%:Z') $sig" | tee -a "${2}"
+    done < <(subscribe_txs ${YELLOWSTONE_GRPC_URL} ${YELLOWSTONE_GRPC_X_TOKEN} ${1} | parse_json)
+}
+
 parse_json() {
     jq -r .transaction.transaction.signature
 }
@@ -46,24 +79,40 @@ ensure_requirements() {
             exit 1
         fi
     done
+
+    for level in ${COMMITMENT_LEVELS}; do
+        case ${level} in
+            processed|confirmed|finalized) ;;
+            *)
+                echo "Unknown commitment level ${level}. Use processed, confirmed or finalized."
+                exit 1
+                ;;
+        esac
+    done
 }
 
 main() {
-    rm -f "${FILENAME}" || true
-
     cd "${SCRIPT_DIR}/../yellowstone-bench"
 
-    while read -r line; do
-        sig=$(echo "$line" | base64 -d | base58)
-        echo "$(date -u '+%Y-%m-%dT%H:%M:%S.%N%:Z') $sig" | tee -a "$FILENAME"
-    done < <(subscribe_txs ${YELLOWSTONE_GRPC_URL} ${YELLOWSTONE_GRPC_X_TOKEN} | parse_json) &
-    s=$!
+    pids=()
+    filenames=()
+    for level in ${COMMITMENT_LEVELS}; do
+        filename="${FILENAME_PREFIX}.txt"
+        if [ "${level}" != "processed" ]; then
+            filename="${FILENAME_PREFIX}_${level}.txt"
+        fi
+        rm -f "${filename}" || true
+
+        capture_txs ${level} "${filename}" &
+        pids+=($!)
+        filenames+=("${filename}")
+    done
 
-    trap "kill -9 $s" INT TERM EXIT
+    trap "kill -9 ${pids[*]}" INT TERM EXIT
 
     sleep ${BENCH_DURATION_SECONDS}
 
-    echo "Benchmark compslete! Stored results in: ${FILENAME}"
+    echo "Benchmark complete! Stored results in: ${filenames[*]}"
 
     cd "${OLDPWD}"
 }
@@ -8,37 +8,68 @@ YELLOWSTONE_GRPC_URL_0="solana-yellowstone-grpc.rpcfast.net:443"
 YELLOWSTONE_GRPC_URL_1="solana-yellowstone-grpc.rpcfast.net:443"
 YELLOWSTONE_GRPC_X_TOKEN_0="1234567890"
 YELLOWSTONE_GRPC_X_TOKEN_1="1234567890"
-FILENAME_0="txs_0.json"
-FILENAME_1="txs_1.json"
+FILENAME_PREFIX_0="txs_0"
+FILENAME_PREFIX_1="txs_1"
+# space-separated list, one parallel subscription per endpoint and level: processed, confirmed, finalized.
+# processed is stored in txs_<n>.json, other levels in txs_<n>_<level>.json
+COMMITMENT_LEVELS="processed"
+# comma-separated lists of base58 pubkeys, empty means no filter.
+# PROGRAM_IDS are merged into ACCOUNT_INCLUDE, which matches txs touching ANY listed key,
+# so setting both widens the stream. Use ACCOUNT_REQUIRED to match txs touching ALL listed keys.
+ACCOUNT_INCLUDE=""
+ACCOUNT_EXCLUDE=""
+ACCOUNT_REQUIRED=""
+PROGRAM_IDS=""
 
 ########################################################
 ###### do not modify below here ########################
 ########################################################
 
-SUBSCRIBE_REQUEST_JSON='{
-    "slots": {},
-    "accounts": {},
-    "transactions": { "alltxs": { "vote": false, "failed": false } },
-    "blocks": {},
-    "blocks_meta": {},
-    "accounts_data_slice": [],
-    "commitment": 0
-}'
+# program ids are matched through account_include, as a transaction
+# invoking a program always has it among its account keys (OR with ACCOUNT_INCLUDE)
+subscribe_request_json() {
+    jq -n \
+        --arg commitment "${1}" \
+        --arg account_include "${ACCOUNT_INCLUDE},${PROGRAM_IDS}" \
+        --arg account_exclude "${ACCOUNT_EXCLUDE}" \
+        --arg account_required "${ACCOUNT_REQUIRED}" \
+        'def csv: split(",") | map(gsub("^\\s+|\\s+$"; "")) | map(select(length > 0));
+        {
+            "slots": {},
+            "accounts": {},
+            "transactions": {
+                "alltxs": {
+                    "vote": false,
+                    "failed": false,
+                    "account_include": ($account_include | csv),
+                    "account_exclude": ($account_exclude | csv),
+                    "account_required": ($account_required | csv)
+                }
+            },
+            "blocks": {},
+            "blocks_meta": {},
+            "accounts_data_slice": [],
+            "commitment": ($commitment | ascii_upcase)
+        }'
+}
 
 subscribe_txs() {
     grpcurl \
         -max-time ${BENCH_DURATION_SECONDS} \
         -H "X-Token: ${2}" \
         -proto geyser.proto \
-        -d "${SUBSCRIBE_REQUEST_JSON}" \
+        -d "$(subscribe_request_json ${3})" \
         ${1} \
         geyser.Geyser/Subscribe
 }
 
+# createdAt is set by the plugin once, when the tx is processed, and is resent unchanged
+# at confirmed and finalized, so receivedAt (local epoch seconds) is kept for --commitments
 parse_json() {
     jq '{
             "txn": .transaction.transaction.signature,
-            "createdAt": .createdAt
+            "createdAt": .createdAt,
+            "receivedAt": now
         }'
 }
 
@@ -49,19 +80,42 @@ ensure_requirements() {
             exit 1
         fi
     done
+
+    for level in ${COMMITMENT_LEVELS}; do
+        case ${level} in
+            processed|confirmed|finalized) ;;
+            *)
+                echo "Unknown commitment level ${level}. Use processed, confirmed or finalized."
+                exit 1
+                ;;
+        esac
+    done
 }
 
 main() {
-    subscribe_txs ${YELLOWSTONE_GRPC_URL_0} ${YELLOWSTONE_GRPC_X_TOKEN_0} | parse_json | tee -a "$FILENAME_0" &
-    s0=$!
+    pids=()
+    filenames=()
+    for level in ${COMMITMENT_LEVELS}; do
+        suffix=""
+        if [ "${level}" != "processed" ]; then
+            suffix="_${level}"
+        fi
+        filename_0="${FILENAME_PREFIX_0}${suffix}.json"
+        filename_1="${FILENAME_PREFIX_1}${suffix}.json"
+
+        subscribe_txs ${YELLOWSTONE_GRPC_URL_0} ${YELLOWSTONE_GRPC_X_TOKEN_0} ${level} | parse_json | tee -a "$filename_0" &
+        pids+=($!)
 
-    subscribe_txs ${YELLOWSTONE_GRPC_URL_1} ${YELLOWSTONE_GRPC_X_TOKEN_1} | parse_json | tee -a "$FILENAME_1" &
-    s1=$!
+        subscribe_txs ${YELLOWSTONE_GRPC_URL_1} ${YELLOWSTONE_GRPC_X_TOKEN_1} ${level} | parse_json | tee -a "$filename_1" &
+        pids+=($!)
+
+        filenames+=("${filename_0}" "${filename_1}")
+    done
 
-    trap "kill -9 $s1; kill -9 $s0" INT TERM EXIT
+    trap "kill -9 ${pids[*]}" INT TERM EXIT
 
     sleep ${BENCH_DURATION_SECONDS}
-    echo "Benchmark complete! Stored results in: ${FILENAME_0} and ${FILENAME_1}"
+    echo "Benchmark complete! Stored results in: ${filenames[*]}"
 }
 
 ensure_requirements
@@ -5,7 +5,7 @@ from datetime import timezone
 import numpy as np
 import os
 
-def load_multiline_json_objects(path):
+def load_multiline_json_objects(path, field="createdAt"):
     data = {}
     buf = []
 
@@ -19,9 +19,9 @@ def load_multiline_json_objects(path):
                 try:
                     obj = json.loads("\n".join(buf))
                     txn = obj.get("txn")
-                    created_at = obj.get("createdAt")
-                    if txn and created_at:
-                        data[txn] = created_at
+                    value = obj.get(field)
+                    if txn and value:
+                        data[txn] = value
                 except json.JSONDecodeError:
                     print(f"Warning: Invalid JSON object:\n{''.join(buf)}")
                 buf = []
@@ -103,9 +103,76 @@ def compare_txns(file1, file2):
     print(f"\n  {earlier / total * 100:.2f}% of txns: {file2_name} is earlier than {file1_name}")
     print(f"  {later / total * 100:.2f}% of txns: {file2_name} is later than {file1_name}")
 
+def compare_commitments(files):
+    # files are ordered from the lowest commitment level to the highest,
+    # e.g. txs_0.json txs_0_confirmed.json txs_0_finalized.json
+    # createdAt is the same at every level, so local receivedAt is compared instead
+    names = [os.path.basename(f) for f in files]
+    datas = [
+        {txn: int(received_at * 1_000_000_000) for txn, received_at in load_multiline_json_objects(f, "receivedAt").items()}
+        for f in files
+    ]
+
+    # pairs of (from, to) indexes: every next level, plus first to last
+    pairs = [(i, i + 1) for i in range(len(files) - 1)]
+    if len(files) > 2:
+        pairs.append((0, len(files) - 1))
+
+    headers = [f"{names[a]} -> {names[b]}" for a, b in pairs]
+
+    print("\n[PER TXN] Δ between commitment levels, ms")
+    print(f"  {'Txn':<88} " + " ".join(headers))
+
+    for txn in sorted(set().union(*datas)):
+        row = []
+        for a, b in pairs:
+            if txn in datas[a] and txn in datas[b]:
+                row.append(f"{(datas[b][txn] - datas[a][txn]) / 1_000_000:.3f}")
+            else:
+                row.append("-")
+
+        print(f"  {txn:<88} " + " ".join(f"{cell:<{len(header)}}" for cell, header in zip(row, headers)))
+
+    print("\n[SUMMARY]")
+    for name, data in zip(names, datas):
+        print(f"  {name}")
+        print(f"    Unique txns: {len(data)}")
+
+    for (a, b), header in zip(pairs, headers):
+        in_both = datas[a].keys() & datas[b].keys()
+        missing = datas[a].keys() - datas[b].keys()
+
+        print(f"\n  {header}")
+        print(f"    Matching txns: {len(in_both)}")
+        print(f"    Txns missing from {names[b]}: {len(missing)}")
+
+        if not in_both:
+            print("    No valid matching transactions found.")
+            continue
+
+        pair_ns = np.array([datas[b][txn] - datas[a][txn] for txn in in_both])
+        total = len(pair_ns)
+        out_of_order = np.sum(pair_ns < 0)
+
+        print(f"    Avg Δ: {np.mean(pair_ns) / 1_000_000:.6f} ms")
+        print(f"    75th percentile Δ: {np.percentile(pair_ns, 75) / 1_000_000:.6f} ms")
+        print(f"    90th percentile Δ: {np.percentile(pair_ns, 90) / 1_000_000:.6f} ms")
+        print(f"    95th percentile Δ: {np.percentile(pair_ns, 95) / 1_000_000:.6f} ms")
+        print(f"    99th percentile Δ: {np.percentile(pair_ns, 99) / 1_000_000:.6f} ms")
+        print(f"    {out_of_order / total * 100:.2f}% of txns ({out_of_order}): {names[b]} is earlier than {names[a]}")
+
+def print_usage():
+    print("Usage: python tx_latency_compare.py file1.json file2.json")
+    print("       python tx_latency_compare.py --commitments txs_0.json txs_0_confirmed.json [txs_0_finalized.json]")
+
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print("Usage: python tx_latency_compare.py file1.json file2.json")
+    if len(sys.argv) > 1 and sys.argv[1] == "--commitments":
+        if len(sys.argv) < 4:
+            print_usage()
+            sys.exit(1)
+        compare_commitments(sys.argv[2:])
+    elif len(sys.argv) == 3:
+        compare_txns(sys.argv[1], sys.argv[2])
+    else:
+        print_usage()
         sys.exit(1)
-
-    compare_txns(sys.argv[1], sys.argv[2])